@@ -1,16 +1,18 @@
-import argparse
-import hashlib
 import random
 from collections import defaultdict
-from typing import TypeVar, Optional, Generic
-from hypothesis.reporting import reporter, report
+from functools import cached_property
+from typing import TYPE_CHECKING, TypeVar, Optional, Generic
 from heapq import heappop, heappush
 
-from graphviz import Digraph
-
 import config
+from graph_analysis import GraphAnalysis
 from random_graph import random_graph
 
+# Rendering (graphviz, hashlib), reporting (hypothesis) and cli (argparse)
+# dependencies are imported lazily, so `generate` stays cheap to import.
+if TYPE_CHECKING:
+    from graphviz import Digraph
+
 
 S = TypeVar("S")
 T = TypeVar("T")
@@ -44,6 +46,13 @@ class FiniteStateMachine(Generic[S, T, P]):
     def state(self) -> S:
         return self._current_state
 
+    @cached_property
+    def analysis(self) -> GraphAnalysis[S, T]:
+        """
+        Structural analysis of transition graph, built on first access.
+        """
+        return GraphAnalysis(self.init_state, self.states, self.transition)
+
     def tick(self, input: T) -> Optional[G]:
         output = None
         if input in self.transition[self.state] and input in self.emit[self.state]:
@@ -108,13 +117,15 @@ def path_generator(fsm: FiniteStateMachine, max_path_length=10, seed=None):
     :param fsm: finite state machine
     :return: path
     """
+    from hypothesis.reporting import report
+
     if seed:
         random.seed(seed)
 
     queue = [(0, (fsm.init_state, []))]
     while queue:
         _, (state, path) = heappop(queue)
-        if len(path) == max_path_length or not fsm.transition[state]:
+        if len(path) == max_path_length or state in fsm.analysis.sinks:
             report("machine = FiniteStateMachine()")
             for i, input in enumerate(path, start=1):
                 output = machine.tick(input)
@@ -130,13 +141,16 @@ def path_generator(fsm: FiniteStateMachine, max_path_length=10, seed=None):
                 heappush(queue, (priority, (next_state, [*path, input])))
 
 
-def fsm2graph(fsm: FiniteStateMachine) -> Digraph:
+def fsm2graph(fsm: FiniteStateMachine) -> "Digraph":
     """
     Transform finite state machine to directer graph for next visualization.
 
     :param fsm: finite state machine
     :return: directed graph that represent finite state machine
     """
+    import hashlib
+
+    from graphviz import Digraph
 
     def hash_state(state):
         return hashlib.md5(state.encode()).hexdigest()
@@ -162,6 +176,8 @@ def fsm2graph(fsm: FiniteStateMachine) -> Digraph:
 
 
 def parser():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Generate finite state machine")
     parser.add_argument(
         "--directory",
@@ -189,6 +205,8 @@ def reporter_wrapper(file):
 
 
 if __name__ == "__main__":
+    from hypothesis.reporting import reporter
+
     args = parser().parse_args()
 
     for seed in args.seeds:
@@ -0,0 +1,185 @@
+from collections import deque
+from functools import cached_property
+from typing import Generic, Iterable, Mapping, Optional, TypeVar
+
+S = TypeVar("S")
+T = TypeVar("T")
+
+
+class GraphAnalysis(Generic[S, T]):
+    """
+    Structural analysis of directed graph given by transition mapping.
+
+    Every fact is computed on first access and cached, so graph must not be
+    modified after analysis was created.
+    """
+
+    def __init__(
+        self,
+        root: S,
+        states: Iterable[S],
+        transition: Mapping[S, Mapping[T, S]],
+    ):
+        self.root = root
+        self.states = list(states)
+        self.transition = transition
+
+    @classmethod
+    def from_edges(cls, root: int, n: int, edges: list[bool]) -> "GraphAnalysis":
+        """
+        Create analysis of graph represented as flat adjacency matrix.
+
+        :param root: root node
+        :param n: number of nodes
+        :param edges: list of edges, edge from i to j is edges[n * i + j]
+        :return: analysis where each edge is labeled by its end node
+        """
+        transition = {
+            i: {j: j for j in range(n) if edges[n * i + j]} for i in range(n)
+        }
+        return cls(root, range(n), transition)
+
+    def successors(self, state: S) -> Iterable[tuple[T, S]]:
+        # use get to not insert new keys into defaultdict
+        return self.transition.get(state, {}).items()
+
+    def bfs(self, source: S) -> tuple[dict[S, int], dict[S, Optional[tuple[S, T]]]]:
+        """
+        Breadth first search from source state.
+
+        :param source: state to start search from
+        :return: distance to each reachable state and its parent in bfs tree,
+        parent is pair of previous state and input that leads from it
+        """
+        distance = {source: 0}
+        parent: dict[S, Optional[tuple[S, T]]] = {source: None}
+        queue = deque([source])
+        while queue:
+            frm = queue.popleft()
+            for input, to in self.successors(frm):
+                if to not in distance:
+                    distance[to] = distance[frm] + 1
+                    parent[to] = (frm, input)
+                    queue.append(to)
+        return distance, parent
+
+    @cached_property
+    def _root_bfs(self) -> tuple[dict[S, int], dict[S, Optional[tuple[S, T]]]]:
+        return self.bfs(self.root)
+
+    @property
+    def distance(self) -> dict[S, int]:
+        """
+        Length of shortest input sequence from root to each reachable state.
+        """
+        return self._root_bfs[0]
+
+    @property
+    def bfs_tree(self) -> dict[S, Optional[tuple[S, T]]]:
+        """
+        Parent (previous state, input) of each reachable state in bfs tree.
+        """
+        return self._root_bfs[1]
+
+    @cached_property
+    def reachable(self) -> set[S]:
+        """
+        States reachable from root.
+        """
+        return set(self.distance)
+
+    def shortest_inputs(self, state: S) -> Optional[list[T]]:
+        """
+        Shortest input sequence leading from root to state.
+
+        :param state: target state
+        :return: list of inputs or None if state is unreachable
+        """
+        if state not in self.bfs_tree:
+            return None
+        inputs = []
+        edge = self.bfs_tree[state]
+        while edge is not None:
+            state, input = edge
+            inputs.append(input)
+            edge = self.bfs_tree[state]
+        inputs.reverse()
+        return inputs
+
+    @cached_property
+    def components(self) -> list[list[S]]:
+        """
+        Strongly connected components in reverse topological order.
+
+        Iterative Tarjan's algorithm, so deep graphs don't hit recursion limit.
+        """
+        index: dict[S, int] = {}
+        low: dict[S, int] = {}
+        stack: list[S] = []
+        on_stack: set[S] = set()
+        components: list[list[S]] = []
+
+        def visit(state):
+            index[state] = low[state] = len(index)
+            stack.append(state)
+            on_stack.add(state)
+            work.append((state, iter(self.successors(state))))
+
+        for start in self.states:
+            if start in index:
+                continue
+            work: list[tuple[S, Iterable[tuple[T, S]]]] = []
+            visit(start)
+            while work:
+                state, edges = work[-1]
+                for _, to in edges:
+                    if to not in index:
+                        visit(to)
+                        break
+                    if to in on_stack:
+                        low[state] = min(low[state], index[to])
+                else:
+                    work.pop()
+                    if work:
+                        frm = work[-1][0]
+                        low[frm] = min(low[frm], low[state])
+                    if low[state] == index[state]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == state:
+                                break
+                        components.append(component)
+
+        return components
+
+    @cached_property
+    def component(self) -> dict[S, int]:
+        """
+        Index of strongly connected component in `components` for each state.
+        """
+        return {
+            state: i
+            for i, component in enumerate(self.components)
+            for state in component
+        }
+
+    @cached_property
+    def sinks(self) -> set[S]:
+        """
+        States without outgoing transitions.
+        """
+        return {state for state in self.states if not self.transition.get(state)}
+
+    @cached_property
+    def diameter(self) -> int:
+        """
+        Longest shortest path between any two states connected by path.
+
+        Requires bfs from every state, so it takes O(n * (n + m)) time.
+        """
+        return max(
+            (max(self.bfs(state)[0].values()) for state in self.states), default=0
+        )
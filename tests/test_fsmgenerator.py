@@ -1,3 +1,7 @@
+import subprocess
+import sys
+from pathlib import Path
+
 from hypothesis import strategies as st, given
 from hypothesis.stateful import (
     RuleBasedStateMachine,
@@ -69,3 +73,38 @@ class GeneratedFiniteStateMachine(RuleBasedStateMachine):
 
 
 TestStateMachine = GeneratedFiniteStateMachine.TestCase
+
+
+# `generate` is imported by short-lived grading processes, keep it cheap
+IMPORT_TIME_BUDGET = 0.05
+LAZY_MODULES = ["graphviz", "hypothesis", "argparse", "hashlib"]
+
+
+def import_fsmgenerator() -> tuple[float, list[str]]:
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import fsmgenerator\n"
+        "print(time.perf_counter() - start)\n"
+        f"print(*[m for m in {LAZY_MODULES!r} if m in sys.modules])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, loaded = result.stdout.split("\n", 1)
+    return float(elapsed), loaded.split()
+
+
+def test_import_is_lazy():
+    _, loaded = import_fsmgenerator()
+    assert not loaded, f"Modules imported eagerly: {loaded}"
+
+
+def test_import_time_budget():
+    # best of several runs to reduce noise from the environment
+    elapsed = min(import_fsmgenerator()[0] for _ in range(5))
+    assert elapsed < IMPORT_TIME_BUDGET, f"Import took {elapsed:.3f}s"
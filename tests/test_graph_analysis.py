@@ -0,0 +1,101 @@
+from hypothesis import given, strategies as st
+
+from fsmgenerator import generate
+from graph_analysis import GraphAnalysis
+from random_graph import random_graph
+
+
+def example():
+    # a -> b <-> c -> d, e is unreachable
+    transition = {
+        "a": {0: "b"},
+        "b": {0: "c", 1: "a"},
+        "c": {0: "b", 1: "d"},
+        "d": {},
+        "e": {0: "a"},
+    }
+    return GraphAnalysis("a", ["a", "b", "c", "d", "e"], transition)
+
+
+def test_example_reachable():
+    analysis = example()
+    assert analysis.reachable == {"a", "b", "c", "d"}
+    assert analysis.distance == {"a": 0, "b": 1, "c": 2, "d": 3}
+
+
+def test_example_shortest_inputs():
+    analysis = example()
+    assert analysis.shortest_inputs("a") == []
+    assert analysis.shortest_inputs("d") == [0, 0, 1]
+    assert analysis.shortest_inputs("e") is None
+
+
+def test_example_components():
+    analysis = example()
+    components = sorted(sorted(component) for component in analysis.components)
+    assert components == [["a", "b", "c"], ["d"], ["e"]]
+    # reverse topological order: sink component goes first
+    assert analysis.components[0] == ["d"]
+    assert analysis.component["a"] == analysis.component["c"]
+
+
+def test_example_sinks_and_diameter():
+    analysis = example()
+    assert analysis.sinks == {"d"}
+    assert analysis.diameter == 4
+
+
+class TestRandomGraphAnalysis:
+    nodes = st.integers(min_value=1, max_value=100)
+
+    @given(data=st.data())
+    def test_all_reachable(self, data):
+        n = data.draw(self.nodes, label="Number of nodes")
+        m = data.draw(
+            st.integers(min_value=(n - 1), max_value=(n ** 2)), label="Number of edges"
+        )
+        root, edges = random_graph(n, m)
+        analysis = GraphAnalysis.from_edges(root, n, edges)
+        assert analysis.reachable == set(range(n))
+
+    @given(data=st.data())
+    def test_bfs_tree_edges(self, data):
+        n = data.draw(self.nodes, label="Number of nodes")
+        m = data.draw(
+            st.integers(min_value=(n - 1), max_value=(n ** 2)), label="Number of edges"
+        )
+        root, edges = random_graph(n, m)
+        analysis = GraphAnalysis.from_edges(root, n, edges)
+        for to, edge in analysis.bfs_tree.items():
+            if edge is None:
+                assert to == root
+            else:
+                frm, _ = edge
+                assert edges[n * frm + to]
+                assert analysis.distance[to] == analysis.distance[frm] + 1
+
+    @given(data=st.data())
+    def test_components_partition(self, data):
+        n = data.draw(self.nodes, label="Number of nodes")
+        m = data.draw(
+            st.integers(min_value=(n - 1), max_value=(n ** 2)), label="Number of edges"
+        )
+        root, edges = random_graph(n, m)
+        analysis = GraphAnalysis.from_edges(root, n, edges)
+        members = [state for component in analysis.components for state in component]
+        assert sorted(members) == list(range(n))
+        # edges never go from earlier component to later one
+        for frm in range(n):
+            for to in range(n):
+                if edges[n * frm + to]:
+                    assert analysis.component[frm] >= analysis.component[to]
+
+
+@given(seed=st.integers(min_value=1))
+def test_shortest_inputs_reach_state(seed):
+    fsm = generate(list(range(20)), list(range(20)), list(range(20)), seed)
+    for state in fsm.states:
+        fsm.reset()
+        for input in fsm.analysis.shortest_inputs(state):
+            fsm.tick(input)
+        assert fsm.state == state
@@ -1,6 +1,7 @@
 import pytest
 from hypothesis import given, strategies as st
 
+from graph_analysis import GraphAnalysis
 from random_graph import wilson, random_graph, random_edges
 
 
@@ -39,18 +40,8 @@ class TestWilson:
     @given(nodes=nodes)
     def test_connectivity(self, nodes):
         root, edges = wilson(nodes)
-        visited = []
-        stack = [root]
-        while stack:
-            current_node = stack.pop()
-            visited.append(current_node)
-            current_node_edges = edges[
-                current_node * nodes : (current_node + 1) * nodes
-            ]
-            for i, edge in enumerate(current_node_edges):
-                if edge and i not in visited:
-                    stack.append(i)
-        assert len(visited) == nodes
+        analysis = GraphAnalysis.from_edges(root, nodes, edges)
+        assert len(analysis.reachable) == nodes
 
     @given(nodes=st.integers(max_value=0))
     def test_wilson_wrong_number_of_nodes(self, nodes):